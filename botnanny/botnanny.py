@@ -1,18 +1,106 @@
 import logging
+import operator
+import random
+import re
 import requests  # type: ignore
+import threading
 import time
 
 from . import __VERSION__
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from py3cw.request import Py3CW  # type: ignore
-from typing import Dict, Set
+from typing import Dict, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
 # 3Commas API documentation:
 # https://github.com/3commas-io/3commas-official-api-docs
-THREE_COMMAS_API_INTERVAL_SECONDS = 1
-THREE_COMMAS_BOTS_BATCH_SIZE = 100
 THREE_COMMAS_DEALS_BATCH_SIZE = 1000
+# 3Commas allows ~300 requests/minute; stay under it with some headroom.
+THREE_COMMAS_MAX_REQUESTS_PER_MINUTE = 250
+THREE_COMMAS_MAX_WORKERS = 5
+# Bot/account metadata changes rarely, so cache 'show' responses for this long.
+THREE_COMMAS_SHOW_CACHE_TTL_SECONDS = 3600
+# Exponential backoff schedule for transient API errors; jitter is added on top.
+_BACKOFF_SECONDS = (0.5, 1.0, 2.0, 5.0, 10.0)
+# Retryable HTTP status codes, matched as whole numbers so IDs that merely contain
+# the digits (e.g. deal id 84295) don't look like a 429.
+_TRANSIENT_STATUS_RE = re.compile(r"\b(429|502|503|504)\b")
+
+
+class RateLimiter:
+    """
+    Token bucket limiting API calls to a maximum number per rolling 60s window.
+
+    Thread-safe, so concurrent workers can share one instance.
+    """
+
+    def __init__(self, max_calls_per_minute: int):
+        """
+        Initialises a RateLimiter instance.
+
+        :param max_calls_per_minute: The maximum number of calls allowed in any 60s window.
+        """
+        self._max_calls = max_calls_per_minute
+        self._timestamps: deque = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until a call is permitted, then records it against the current window.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= 60.0:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self._max_calls:
+                    self._timestamps.append(now)
+                    return
+                wait_seconds = 60.0 - (now - self._timestamps[0])
+            time.sleep(wait_seconds)
+
+
+# Deal statuses that mean a deal no longer needs profit-protection.
+_INACTIVE_STATUSES = frozenset({
+    "cancelled",
+    "completed",
+    "failed",
+    "panic_sell_pending",
+    "panic_sell_order_placed",
+    "panic_sold",
+    "cancel_pending",
+    "stop_loss_pending",
+    "stop_loss_finished",
+    "stop_loss_order_placed",
+    "switched",
+    "switched_take_profit",
+    "liquidated",
+    "bought_safety_pending",
+    "bought_take_profit_pending",
+    "settled"
+})
+
+# Batched field extraction for the per-deal hot paths; one itemgetter call replaces a
+# run of individual dict subscripts.
+_DEAL_ACTIVE_FIELDS = operator.itemgetter("id", "status", "finished?")
+_DEAL_PROFIT_FIELDS = operator.itemgetter(
+    "status",
+    "strategy",
+    "leverage_type",
+    "leverage_custom_value",
+    "stop_loss_type",
+    "stop_loss_percentage",
+    "tsl_enabled",
+    "bot_name",
+    "pair"
+)
+
+# Adaptive polling: poll no faster than this when a deal is close to the target PnL.
+ADAPTIVE_POLL_FLOOR_SECONDS = 30
+# A deal is considered "near" the target once its PnL exceeds this fraction of target_pnl_percent.
+ADAPTIVE_POLL_NEAR_TARGET_FACTOR = 0.5
 
 
 class BotNanny:
@@ -64,159 +152,294 @@ class BotNanny:
             secret=self.api_secret,
             request_options={
                 'request_timeout': 10,
-                'nr_of_retries': 1,
-                'retry_status_codes': [502],
-                'retry_backoff_factor': 0.1
+                'nr_of_retries': 5,
+                'retry_status_codes': [429, 502, 503, 504],
+                'retry_backoff_factor': 1.0
             }
         )
 
+        self._rate_limiter = RateLimiter(THREE_COMMAS_MAX_REQUESTS_PER_MINUTE)
+        self._show_cache: Dict = {}
+        self._stop = threading.Event()
+
+        # Reuse a single session for Telegram notifications so repeated messages
+        # share one pooled HTTPS connection instead of a fresh handshake each time.
+        self._tg_session = requests.Session()
+        self._tg_session.mount(
+            "https://api.telegram.org",
+            requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        )
+        # Resolve the Telegram endpoint once; _telegram_url stays None if not configured.
+        self._telegram_url = None
+        self._telegram_chat_id = None
+        telegram_config = config.get("telegram", {})
+        telegram_bot_token = telegram_config.get("telegram_bot_token", None)
+        telegram_chat_id = telegram_config.get("telegram_chat_id", None)
+        if telegram_bot_token and telegram_chat_id:
+            self._telegram_url = f"https://api.telegram.org/bot{telegram_bot_token}/sendMessage"
+            self._telegram_chat_id = telegram_chat_id
+
     def run(self):
         """
         Start processing Bot Deals.
         """
         self.output_startup_message()
         self._send_telegram_message(f"*BotNanny {__VERSION__}* started")
-        while True:
+        while not self._stop.is_set():
+            active_deals = []
             try:
-                discovered_bot_ids = self._fetch_bot_ids_for_account_ids(self.selected_account_ids)
-                bot_ids = discovered_bot_ids.union(self.selected_bot_ids)
-                discovered_deal_ids = self._fetch_deal_ids_for_bot_ids(bot_ids)
-                deal_ids = discovered_deal_ids.union(self.selected_deal_ids)
-                self._process_deal_ids(deal_ids)
+                active_deals = self._fetch_and_process_active_deals()
             except Exception as ex:
-                logger.error(f"Caught Exception in BotNanny.run(): {ex}")
+                logger.error("Caught Exception in BotNanny.run(): %s", ex)
             finally:
-                # Sleep until next check.
-                logger.info(f"Sleeping for {self.interval_seconds}s ...")
-                time.sleep(self.interval_seconds)
+                # Sleep until next check; a stop request interrupts the wait immediately.
+                sleep_seconds = self._next_sleep_seconds(active_deals)
+                logger.info("Sleeping for %ss ...", sleep_seconds)
+                self._stop.wait(sleep_seconds)
+        logger.info("BotNanny stopped")
 
-    def _fetch_bot_ids_for_account_ids(self, account_ids: Set[int]) -> Set[int]:
+    def stop(self):
         """
-        Fetches all Bot IDs for the specified Account IDs.
+        Requests a graceful shutdown of the run loop.
 
-        :param account_ids: A set containing 3Commas Account IDs.
-        :return: A set containing 3Commas Bot IDs.
+        Safe to call from a signal handler or another thread; any in-progress sleep is
+        interrupted and the current batch of deals finishes promptly.
         """
-        bot_ids = set()
-        for account_id in account_ids:
-            try:
-                time.sleep(THREE_COMMAS_API_INTERVAL_SECONDS)
-                error, data = self.py3cw.request(
-                    entity="accounts",
-                    action="account_info",
-                    action_id=f"{account_id}"
-                )
-                if error:
-                    logger.error(f"Failed to fetch account info for account id {account_id}: {error}")
-                    continue
+        self._stop.set()
 
-                account_name = data["name"]
-
-                logger.info(f"Fetching bot ids for account '{account_name}'")
-                account_bot_ids = set()
-                completed = False
-                offset = 0
-                while not completed:
-                    error, data = self.py3cw.request(
-                        entity="bots",
-                        action="",
-                        payload={
-                            "limit": THREE_COMMAS_BOTS_BATCH_SIZE,
-                            "offset": offset,
-                            "account_id": account_id
-                        }
-                    )
-                    if error:
-                        logger.error(f"Failed to fetch bot ids for account '{account_name}': {error}")
-                        completed = True  # Give up on this account if we hit errors.
-                    else:
-                        for bot in data:
-                            bot_name = bot["name"]
-                            logger.info(f"Found bot '{bot_name}'")
-                            account_bot_ids.add(bot["id"])
-                        offset += len(data)  # Increase offset for next call.
-                        completed = len(data) < THREE_COMMAS_BOTS_BATCH_SIZE  # Have we finished?
-                logger.debug(f"Found {len(account_bot_ids)} bots for account '{account_name}'")
-                bot_ids.update(account_bot_ids)
-            except Exception as ex:
-                logger.error(f"Caught Exception fetching bot ids for account id {account_id}: {ex}")
-        return bot_ids
+    def _request_with_backoff(self, **kwargs):
+        """
+        Issues a rate-limited 3Commas API request, retrying transient errors with backoff.
+
+        Retries follow an exponential schedule with random jitter so concurrent workers don't
+        hammer a degraded API in lockstep. Non-transient errors are returned to the caller as-is.
+
+        :param kwargs: Arguments passed through to py3cw.request.
+        :return: The (error, data) tuple from py3cw.request.
+        """
+        attempt = 0
+        while True:
+            self._rate_limiter.acquire()
+            error, data = self.py3cw.request(**kwargs)
+            if not error or not self._error_is_transient(error) or attempt >= len(_BACKOFF_SECONDS):
+                return error, data
+            delay_seconds = _BACKOFF_SECONDS[attempt]
+            delay_seconds += random.uniform(0, 0.25 * delay_seconds)
+            logger.warning("Transient API error, retrying in %.1fs: %s", delay_seconds, error)
+            time.sleep(delay_seconds)
+            attempt += 1
+
+    @staticmethod
+    def _error_is_transient(error) -> bool:
+        """
+        Checks a py3cw error to decide if retrying the request could help.
+
+        :param error: The error returned by py3cw.request.
+        :return: True if the error looks like rate-limiting or a server-side blip, otherwise False.
+        """
+        error_text = str(error).lower()
+        if any(signature in error_text for signature in ("too many requests", "rate limit", "timeout")):
+            return True
+        return _TRANSIENT_STATUS_RE.search(error_text) is not None
 
-    def _fetch_deal_ids_for_bot_ids(self, bot_ids: Set[int]) -> Set[int]:
+    def _fetch_and_process_active_deals(self) -> List[Dict]:
         """
-        Fetches all Bot Deal IDs for the specified Bot IDs.
+        Fetches all active Bot Deals for the configured accounts, bots and deals, and applies
+        profit-protection to each.
+
+        The deals list endpoint filters server-side by account_id and scope=active and already
+        returns full deal objects, so one paged scan per account replaces the old
+        bot-by-bot fan-out, and each deal is processed directly instead of being re-fetched
+        with an individual 'show' call. Explicitly configured bot_ids still use a per-bot scan,
+        and explicitly configured deal_ids not otherwise covered fall back to individual fetches.
 
-        :param bot_ids: A set containing 3Commas Bot IDs.
-        :return: A set containing 3Commas Bot Deal IDs.
+        :return: A list of the active deal dictionaries that were processed.
         """
-        deal_ids = set()
-        for bot_id in bot_ids:
+        active_deals: List[Dict] = []
+        processed_deal_ids = set()
+
+        for account_id in self.selected_account_ids:
+            if self._stop.is_set():
+                return active_deals
             try:
-                time.sleep(THREE_COMMAS_API_INTERVAL_SECONDS)
-                error, data = self.py3cw.request(
-                    entity="bots",
-                    action="show",
-                    action_id=f"{bot_id}"
-                )
-                if error:
-                    logger.error(f"Failed to fetch bot info for bot id {bot_id}: {error}")
+                logger.info("Fetching active deals for account id %s", account_id)
+                account_deal_count = 0
+                for deal in self._paged("deals", "", {"account_id": account_id, "scope": "active"}):
+                    deal_id = deal["id"]
+                    logger.debug("Found active deal id %s", deal_id)
+                    processed_deal_ids.add(deal_id)
+                    account_deal_count += 1
+                    if self._process_fetched_deal(deal):
+                        active_deals.append(deal)
+                logger.info("Found %s active deals for account id %s", account_deal_count, account_id)
+            except Exception as ex:
+                logger.error("Caught Exception fetching deals for account id %s: %s", account_id, ex)
+
+        for bot_id in self.selected_bot_ids:
+            if self._stop.is_set():
+                return active_deals
+            try:
+                bot = self._cached_show("bots", bot_id)
+                if bot is None:
                     continue
-                bot_name = data["name"]
-
-                logger.info(f"Fetching active deal ids for bot '{bot_name}'")
-                bot_deal_ids = set()
-                completed = False
-                offset = 0
-                while not completed:
-                    error, data = self.py3cw.request(
-                        entity="deals",
-                        action="",
-                        payload={
-                            "limit": THREE_COMMAS_DEALS_BATCH_SIZE,
-                            "offset": offset,
-                            "bot_id": bot_id,
-                            "scope": "active"
-                        }
-                    )
-                    if error:
-                        logger.error(f"Failed to fetch active deals for bot '{bot_name}': {error}")
-                        completed = True  # Give up on this bot if we hit errors.
-                    else:
-                        for deal in data:
-                            deal_id = deal["id"]
-                            logger.debug(f"Found active deal id {deal_id}")
-                            bot_deal_ids.add(deal_id)
-                        offset += len(data)  # Increase offset for next call.
-                        completed = len(data) < THREE_COMMAS_DEALS_BATCH_SIZE  # Have we finished?
-                logger.info(f"Found {len(bot_deal_ids)} active deals for bot '{bot_name}'")
-                deal_ids.update(bot_deal_ids)
+                bot_name = bot["name"]
+
+                logger.info("Fetching active deals for bot '%s'", bot_name)
+                bot_deal_count = 0
+                for deal in self._paged("deals", "", {"bot_id": bot_id, "scope": "active"}):
+                    deal_id = deal["id"]
+                    if deal_id in processed_deal_ids:
+                        continue  # Already covered by an account scan.
+                    logger.debug("Found active deal id %s", deal_id)
+                    processed_deal_ids.add(deal_id)
+                    bot_deal_count += 1
+                    if self._process_fetched_deal(deal):
+                        active_deals.append(deal)
+                logger.info("Found %s active deals for bot '%s'", bot_deal_count, bot_name)
             except Exception as ex:
-                logger.error(f"Caught Exception fetching deal ids for bot id {bot_id}: {ex}")
-        return deal_ids
+                logger.error("Caught Exception fetching deals for bot id %s: %s", bot_id, ex)
+
+        # Explicitly selected deals not covered by the scans above still need an individual fetch.
+        # Skip the set difference entirely in the common case of no configured deal_ids.
+        if self.selected_deal_ids:
+            active_deals.extend(self._process_deal_ids(self.selected_deal_ids - processed_deal_ids))
+        return active_deals
+
+    def _paged(self, entity: str, action: str, payload: Dict, batch_size: int = THREE_COMMAS_DEALS_BATCH_SIZE):
+        """
+        Yields items from a paginated 3Commas list endpoint as each page arrives.
+
+        Callers stream-process items without materialising the full result set, and the
+        offset bookkeeping lives in one place instead of being repeated at every call site.
+        Stops early (after logging) if a page fetch fails.
 
-    def _process_deal_ids(self, deal_ids: Set[int]):
+        :param entity: The 3Commas entity type (e.g. "deals").
+        :param action: The 3Commas action (usually "" for list endpoints).
+        :param payload: Extra query parameters; limit/offset are added per page.
+        :param batch_size: The number of items to request per page.
+        """
+        offset = 0
+        while not self._stop.is_set():
+            error, data = self._request_with_backoff(
+                entity=entity,
+                action=action,
+                payload={**payload, "limit": batch_size, "offset": offset}
+            )
+            if error:
+                logger.error("Failed to fetch %s page at offset %s: %s", entity, offset, error)
+                return
+            yield from data
+            offset += len(data)  # Increase offset for next call.
+            if len(data) < batch_size:  # Have we finished?
+                return
+
+    def _process_deal_ids(self, deal_ids: Set[int]) -> List[Dict]:
         """
         Processes a specified collection of 3Commas Bot Deal IDs.
 
         :param deal_ids: A set containing 3Commas Bot Deal IDs.
+        :return: A list of the active deal dictionaries that were processed.
         """
-        for deal_id in deal_ids:
-            try:
-                time.sleep(THREE_COMMAS_API_INTERVAL_SECONDS)
-                error, data = self.py3cw.request(
-                    entity="deals",
-                    action="show",
-                    action_id=f"{deal_id}"
-                )
-                if error:
-                    logger.error(f"Failed to fetch deal info for deal id {deal_id}: {error}")
-                    return
+        if not deal_ids:
+            return []
+        # The per-deal fetches are independent, so let a small worker pool overlap them;
+        # the shared rate limiter keeps the combined request rate within the API budget.
+        with ThreadPoolExecutor(max_workers=THREE_COMMAS_MAX_WORKERS) as executor:
+            return [deal for deal in executor.map(self._process_one_deal, deal_ids) if deal is not None]
+
+    def _cached_show(self, entity: str, action_id: int, ttl: float = THREE_COMMAS_SHOW_CACHE_TTL_SECONDS):
+        """
+        Fetches a single 3Commas object via its 'show' endpoint, using a TTL cache.
 
-                # Apply profit-protection logic here.
-                if self._deal_is_active(data):
-                    self._apply_deal_profit_protection(data)
-            except Exception as ex:
-                logger.error(f"Caught Exception processing deal id {deal_id}: {ex}")
+        Bot and account metadata changes rarely, so steady-state cycles reuse the cached object
+        instead of re-issuing the same request (and paying the API rate limit) every interval.
+
+        :param entity: The 3Commas entity type (e.g. "bots").
+        :param action_id: The ID of the object to fetch.
+        :param ttl: How long a cached object stays fresh, in seconds.
+        :return: A dictionary containing the object, or None if the fetch failed.
+        """
+        cache_key = (entity, action_id)
+        cached = self._show_cache.get(cache_key)
+        now = time.monotonic()
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        error, data = self._request_with_backoff(
+            entity=entity,
+            action="show",
+            action_id=f"{action_id}"
+        )
+        if error:
+            logger.error("Failed to fetch %s info for id %s: %s", entity, action_id, error)
+            return None
+        self._show_cache[cache_key] = (now, data)
+        return data
+
+    def _process_one_deal(self, deal_id: int) -> Optional[Dict]:
+        """
+        Fetches a single 3Commas Bot Deal and applies profit-protection to it.
+
+        :param deal_id: A 3Commas Bot Deal ID.
+        :return: The deal dictionary if it was active and processed, otherwise None.
+        """
+        if self._stop.is_set():
+            return None
+        try:
+            error, data = self._request_with_backoff(
+                entity="deals",
+                action="show",
+                action_id=f"{deal_id}"
+            )
+            if error:
+                logger.error("Failed to fetch deal info for deal id %s: %s", deal_id, error)
+                return None
+
+            if self._process_fetched_deal(data):
+                return data
+        except Exception as ex:
+            logger.error("Caught Exception processing deal id %s: %s", deal_id, ex)
+        return None
+
+    def _process_fetched_deal(self, deal: Dict) -> bool:
+        """
+        Applies profit-protection to a deal dictionary that has already been fetched.
+
+        :param deal: Dictionary containing the DCA Bot Deal information (fetched from 3Commas).
+        :return: True if the deal was active and processed, otherwise False.
+        """
+        if not self._deal_is_active(deal):
+            return False
+        self._apply_deal_profit_protection(deal)
+        return True
+
+    def _next_sleep_seconds(self, deals: List[Dict]) -> int:
+        """
+        Chooses how long to sleep before the next processing cycle.
+
+        Polls denser when a deal is approaching the target PnL (down to a floor) and falls back to
+        the configured interval when nothing is close, so detection latency shrinks exactly when a
+        StopLoss update is likely to be needed.
+
+        :param deals: The active deal dictionaries seen in the last cycle.
+        :return: The number of seconds to sleep.
+        """
+        floor_seconds = min(ADAPTIVE_POLL_FLOOR_SECONDS, self.interval_seconds)
+        best_pnl = None
+        for deal in deals:
+            try:
+                pnl = float(deal["actual_profit_percentage"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if best_pnl is None or pnl > best_pnl:
+                best_pnl = pnl
+        near_threshold = ADAPTIVE_POLL_NEAR_TARGET_FACTOR * self.target_pnl_percent
+        if best_pnl is None or best_pnl < near_threshold:
+            return self.interval_seconds
+        if best_pnl >= self.target_pnl_percent:
+            return floor_seconds
+        # Scale linearly from the configured interval down to the floor as PnL nears the target.
+        fraction = (best_pnl - near_threshold) / (self.target_pnl_percent - near_threshold)
+        return max(floor_seconds, int(self.interval_seconds - fraction * (self.interval_seconds - floor_seconds)))
 
     def _deal_is_active(self, deal: Dict):
         """
@@ -225,30 +448,12 @@ class BotNanny:
         :param deal: Dictionary containing the DCA Bot Deal information (fetched from 3Commas).
         :return: True if the deal is considered active, otherwise False.
         """
-        deal_id = deal["id"]
-        deal_status = deal["status"]
-        if deal["finished?"]:
-            logger.debug(f"Ignoring finished deal id {deal_id}")
+        deal_id, deal_status, finished = _DEAL_ACTIVE_FIELDS(deal)
+        if finished:
+            logger.debug("Ignoring finished deal id %s", deal_id)
             return False
-        if deal["status"] in [
-            "cancelled",
-            "completed",
-            "failed",
-            "panic_sell_pending",
-            "panic_sell_order_placed",
-            "panic_sold",
-            "cancel_pending",
-            "stop_loss_pending",
-            "stop_loss_finished",
-            "stop_loss_order_placed",
-            "switched",
-            "switched_take_profit",
-            "liquidated",
-            "bought_safety_pending",
-            "bought_take_profit_pending",
-            "settled"
-        ]:
-            logger.debug(f"Ignoring deal id {deal_id} with status '{deal_status}'")
+        if deal_status in _INACTIVE_STATUSES:
+            logger.debug("Ignoring deal id %s with status '%s'", deal_id, deal_status)
             return False
         return True
 
@@ -260,38 +465,46 @@ class BotNanny:
         """
         try:
             deal_id = deal["id"]
-            deal_status = deal["status"]
-            strategy = deal["strategy"]
-            leverage_type = deal["leverage_type"]
+            # Cheap numeric gate first: most deals are nowhere near the target PnL, so skip
+            # the remaining field parsing and log formatting for them entirely.
+            try:
+                actual_profit_percentage = float(deal["actual_profit_percentage"])
+            except (KeyError, TypeError, ValueError):
+                actual_profit_percentage = 0.0
+            if actual_profit_percentage < self.target_pnl_percent:
+                logger.debug("Deal id %s below target PnL (%.2f%%)", deal_id, actual_profit_percentage)
+                return
+            (deal_status, strategy, leverage_type, leverage_custom_value, stop_loss_type,
+             raw_stop_loss_percentage, tsl_enabled, bot, pair) = _DEAL_PROFIT_FIELDS(deal)
             leverage_amount = 1.0
-            if deal["leverage_custom_value"]:
-                leverage_amount = float(deal["leverage_custom_value"])
-            stop_loss_type = deal["stop_loss_type"]
+            if leverage_custom_value:
+                leverage_amount = float(leverage_custom_value)
             # Flip sign from 3Commas API convention for DCA Bot-Deals.
-            stop_loss_percentage = -float(deal["stop_loss_percentage"])
-            tsl_enabled = deal["tsl_enabled"]
+            stop_loss_percentage = -float(raw_stop_loss_percentage)
             current_sl_is_loss = (stop_loss_type == "stop_loss") and (stop_loss_percentage < 0) and not tsl_enabled
-            actual_profit_percentage = float(deal['actual_profit_percentage'])
-            bot_name = f"{deal['bot_name']} ({deal['pair']})"
-            logger.info(f"Checking deal id {deal_id}")
-            logger.info(
-                f"{bot_name}: " +
-                ", ".join(
-                    [
-                        f"deal_id={deal_id}",
-                        f"deal_status={deal_status}",
-                        f"strategy={strategy}",
-                        f"leverage_type={leverage_type}",
-                        f"leverage_amount={leverage_amount}",
-                        f"stop_loss_type={stop_loss_type}",
-                        f"stop_loss_percentage={stop_loss_percentage}",
-                        f"actual_profit_percentage={actual_profit_percentage}"
-                    ]
+            bot_name = f"{bot} ({pair})"
+            # Only build the per-deal summary string if it would actually be emitted.
+            # The summary includes deal_id, so no separate "Checking deal id" record is needed.
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"{bot_name}: " +
+                    ", ".join(
+                        [
+                            f"deal_id={deal_id}",
+                            f"deal_status={deal_status}",
+                            f"strategy={strategy}",
+                            f"leverage_type={leverage_type}",
+                            f"leverage_amount={leverage_amount}",
+                            f"stop_loss_type={stop_loss_type}",
+                            f"stop_loss_percentage={stop_loss_percentage}",
+                            f"actual_profit_percentage={actual_profit_percentage}"
+                        ]
+                    )
                 )
-            )
             # Evaluate deal to determine if StopLoss should be applied or updated.
+            # The PnL gate above already established actual_profit_percentage >= target_pnl_percent.
             # TODO: Allow multiple PnL/SL pairs
-            if current_sl_is_loss and (actual_profit_percentage >= self.target_pnl_percent):
+            if current_sl_is_loss:
                 message = f"{bot_name}: Deal id {deal_id} has reached {self.target_pnl_percent}% PnL, " + \
                           f"updating SL to {self.adjusted_sl_percent}%"
                 logger.info(message)
@@ -299,9 +512,9 @@ class BotNanny:
                 # Update SL to self.adjusted_sl_percent.
                 self._update_deal_stoploss(deal, self.adjusted_sl_percent)
             else:
-                logger.info(f"{bot_name}: Nothing to do for deal id {deal_id}")
+                logger.info("%s: Nothing to do for deal id %s", bot_name, deal_id)
         except Exception as ex:
-            logger.error(f"Caught Exception applying deal profit-protection: {ex}")
+            logger.error("Caught Exception applying deal profit-protection: %s", ex)
 
     def _update_deal_stoploss(self, deal: Dict, stop_loss_percentage: float) -> bool:
         """
@@ -316,7 +529,7 @@ class BotNanny:
             bot_name = f"{deal['bot_name']} ({deal['pair']})"
             # NOTE: DCA Bots on 3Commas use a flipped SL value.
             # i.e. a +ve SL on 3C means a true SL at a loss, and a -ve SL on 3C actually means a true SL in profit.
-            error, data = self.py3cw.request(
+            error, data = self._request_with_backoff(
                 entity="deals",
                 action="update_deal",
                 action_id=f"{deal_id}",
@@ -339,7 +552,7 @@ class BotNanny:
             self._send_telegram_message(message)
             return True
         except Exception as ex:
-            logger.error(f"Caught Exception updating deal stoploss: {ex}")
+            logger.error("Caught Exception updating deal stoploss: %s", ex)
             return False
 
     def _send_telegram_message(self, message: str):
@@ -348,22 +561,23 @@ class BotNanny:
 
         :param message: The message to be sent.
         """
-        if "telegram" in self.config:
-            telegram_config = self.config["telegram"]
-            telegram_bot_token = telegram_config.get("telegram_bot_token", None)
-            telegram_chat_id = telegram_config.get("telegram_chat_id", None)
-            escaped_message = message.replace("_", "\\_")
-            if telegram_bot_token and telegram_chat_id and message:
-                url = f"https://api.telegram.org/bot{telegram_bot_token}/sendMessage?" + \
-                      f"chat_id={telegram_chat_id}&text={escaped_message}&parse_mode=Markdown"
-                requests.get(url)
+        if self._telegram_url and message:
+            self._tg_session.post(
+                self._telegram_url,
+                data={
+                    "chat_id": self._telegram_chat_id,
+                    "text": message.replace("_", "\\_"),
+                    "parse_mode": "Markdown"
+                },
+                timeout=5
+            )
 
     @staticmethod
     def output_startup_message():
         """
         Outputs a startup message to the console and/or logfile.
         """
-        logger.info(f"BotNanny {__VERSION__}")
+        logger.info("BotNanny %s", __VERSION__)
         logger.info("Use at your own risk, no warranty supplied or implied!")
         logger.info("The authors and any contributors assume NO RESPONSIBILITY for your trading results.")
         logger.info("If you find this program useful, please consider sending a small tip...")
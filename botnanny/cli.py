@@ -0,0 +1,88 @@
+import argparse
+import atexit
+import logging
+import os
+import queue
+import signal
+import sys
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib  # type: ignore
+
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from botnanny.botnanny import BotNanny
+from . import __VERSION__
+
+logger = logging.getLogger(__name__)
+
+
+def main(args):
+    """
+    Main entry point.
+
+    :param args: Command-line arguments.
+    """
+    # Parse command-line arguments.
+    root_parser = argparse.ArgumentParser(prog="python3 -m botnanny")
+    root_parser.add_argument("--logpath", type=str, help="path for log files", default="/var/log/botnanny")
+    root_parser.add_argument("--config", type=str, help="config file", required=True)
+    root_parser.add_argument("-v", "--version", action="version", version=f"BotNanny {__VERSION__}")
+
+    args.pop(0)  # Remove the script path from the start of args.
+    args = root_parser.parse_args(args)
+
+    # Configure logging.
+    # Log records go onto an unbounded queue and a background listener thread does the actual
+    # stdout/file I/O, so logging calls in the processing loops never block on disk or terminal.
+    os.makedirs(args.logpath, exist_ok=True)
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    file_handler = TimedRotatingFileHandler(os.path.join(args.logpath, "botnanny.log"), when="midnight", utc=True)
+    file_handler.setFormatter(formatter)
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    # Message-only formatter so the listener's handlers apply the real format exactly once.
+    queue_handler.setFormatter(logging.Formatter())
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[queue_handler]
+    )
+    listener = QueueListener(log_queue, stream_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)  # Flush any queued records on shutdown.
+    # None of the handlers log thread/process details, so skip collecting them per record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # Read config file.
+    config = read_config(args.config)
+
+    botnanny = BotNanny(config)
+
+    # Exit promptly on SIGTERM/SIGINT instead of sleeping out the remaining interval;
+    # the atexit hook above then flushes any queued log records.
+    signal.signal(signal.SIGTERM, lambda signum, frame: botnanny.stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: botnanny.stop())
+
+    botnanny.run()
+
+
+def read_config(filepath: str):
+    """
+    Reads a TOML config file.
+
+    :param filepath: The location of the config file.
+    :return: A dictionary representation of the TOML config file.
+    """
+    try:
+        logger.debug("Reading config file: %s", filepath)
+        with open(filepath, "rb") as file:
+            config_toml = tomllib.load(file)
+            return config_toml
+    except OSError:
+        logger.exception("Failed to read config file: %s", filepath)
+        return None